@@ -5,27 +5,68 @@ This package provides a framework for developing, installing, and managing
 extensions for Open WebUI that works with pip-installed instances.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
-from .extension_system import (
-    Extension,
-    UIExtension,
-    APIExtension,
-    ModelExtension,
-    ToolExtension,
-    ThemeExtension,
-)
-
-from .extension_system.hooks import (
-    register_hook,
-    register_callback,
-    execute_hook,
-)
-
-from .extension_system.decorators import (
-    hook,
-    ui_component,
-    api_route,
-    tool,
-    setting,
-)
+# Lazy re-exports (PEP 562): map each public name to the submodule that
+# defines it, so importing the package (e.g. for __version__ or an entry
+# point) does not pull in the whole extension system up front.
+_LAZY_IMPORTS = {
+    "Extension": ".extension_system",
+    "UIExtension": ".extension_system",
+    "APIExtension": ".extension_system",
+    "ModelExtension": ".extension_system",
+    "ToolExtension": ".extension_system",
+    "ThemeExtension": ".extension_system",
+    "register_hook": ".extension_system.hooks",
+    "register_callback": ".extension_system.hooks",
+    "execute_hook": ".extension_system.hooks",
+    "hook": ".extension_system.decorators",
+    "ui_component": ".extension_system.decorators",
+    "api_route": ".extension_system.decorators",
+    "tool": ".extension_system.decorators",
+    "setting": ".extension_system.decorators",
+    "extension_entry": ".extension_system.decorators",
+}
+
+__all__ = ["__version__"] + list(_LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    from .extension_system import (
+        Extension,
+        UIExtension,
+        APIExtension,
+        ModelExtension,
+        ToolExtension,
+        ThemeExtension,
+    )
+    from .extension_system.hooks import (
+        register_hook,
+        register_callback,
+        execute_hook,
+    )
+    from .extension_system.decorators import (
+        hook,
+        ui_component,
+        api_route,
+        tool,
+        setting,
+        extension_entry,
+    )
+
+
+def __getattr__(name):
+    """Resolve lazy re-exports on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache so subsequent lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
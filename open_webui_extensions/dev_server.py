@@ -2,6 +2,9 @@
 Development server for testing extensions outside Open WebUI.
 """
 
+import gzip
+import hashlib
+import mimetypes
 import os
 import sys
 import importlib.util
@@ -12,7 +15,6 @@ from pathlib import Path
 import uvicorn
 from fastapi import FastAPI, Request, Response, HTTPException
 from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
 
 from open_webui_extensions.extension_system.registry import initialize_registry
 from open_webui_extensions.manager.api import create_router
@@ -42,10 +44,44 @@ def create_dev_app() -> FastAPI:
     # Register extension manager UI routes
     register_ui_routes(app)
     
-    # Mount static files
+    # Serve static files from a precompressed in-memory cache instead of
+    # StaticFiles, which stats the filesystem on every request. The assets
+    # are tiny and never change while the server runs, so read them once,
+    # gzip them, and answer conditional requests with 304s.
     static_dir = os.path.join(os.path.dirname(__file__), "manager", "ui", "static")
     if os.path.exists(static_dir):
-        app.mount("/static", StaticFiles(directory=static_dir), name="static")
+        static_cache: Dict[str, Tuple[bytes, bytes, str, str]] = {}
+        for root, _dirs, files in os.walk(static_dir):
+            for filename in files:
+                file_path = os.path.join(root, filename)
+                rel_path = os.path.relpath(file_path, static_dir).replace(os.sep, "/")
+                with open(file_path, "rb") as f:
+                    raw = f.read()
+                media_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+                etag = f'"{hashlib.sha256(raw).hexdigest()}"'
+                static_cache[rel_path] = (raw, gzip.compress(raw, 9), media_type, etag)
+
+        @app.get("/static/{file_path:path}")
+        async def get_static_file(file_path: str, request: Request):
+            """Serve a precompressed static asset from memory."""
+            cached = static_cache.get(file_path)
+            if cached is None:
+                raise HTTPException(status_code=404, detail="Not found")
+
+            raw, compressed, media_type, etag = cached
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers={"ETag": etag})
+
+            headers = {
+                "Cache-Control": "public, max-age=31536000, immutable",
+                "ETag": etag,
+                "Vary": "Accept-Encoding",
+            }
+            # Only send the gzip copy to clients that accept it
+            if "gzip" in request.headers.get("accept-encoding", ""):
+                headers["Content-Encoding"] = "gzip"
+                return Response(compressed, media_type=media_type, headers=headers)
+            return Response(raw, media_type=media_type, headers=headers)
     
     @app.get("/")
     async def index():
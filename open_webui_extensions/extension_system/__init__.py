@@ -31,11 +31,13 @@ from .decorators import (
     api_route,
     tool,
     setting,
+    extension_entry,
 )
 
 from .utils import (
     load_extension,
     discover_extensions,
+    discover_extension_metadata,
     setup_extensions_directory,
 )
 
@@ -63,9 +65,11 @@ __all__ = [
     "api_route",
     "tool",
     "setting",
+    "extension_entry",
     
     # Utilities
     "load_extension",
     "discover_extensions",
+    "discover_extension_metadata",
     "setup_extensions_directory",
 ]
@@ -0,0 +1,30 @@
+"""
+JSON helpers with an optional orjson fast path.
+
+orjson decodes and encodes several times faster than the stdlib and
+produces bytes directly. Callers read and write files in binary mode and
+go through these helpers; when orjson is not installed they fall back to
+the stdlib with identical semantics.
+"""
+
+try:
+    import orjson
+
+    def loads(data):
+        """Deserialize JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def dumps(obj) -> bytes:
+        """Serialize an object to compact JSON bytes."""
+        return orjson.dumps(obj)
+
+except ImportError:
+    import json
+
+    def loads(data):
+        """Deserialize JSON from bytes or str."""
+        return json.loads(data)
+
+    def dumps(obj) -> bytes:
+        """Serialize an object to compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
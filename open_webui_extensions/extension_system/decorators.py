@@ -4,8 +4,26 @@ Decorators for extension features.
 
 import functools
 import inspect
+import sys
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
+def extension_entry(cls: Type) -> Type:
+    """Decorator to declare a class as its module's extension entry point.
+
+    Marking the entry class lets the loader resolve it directly instead of
+    scanning every module attribute for Extension subclasses.
+
+    Args:
+        cls: The extension class.
+
+    Returns:
+        The decorated class.
+    """
+    module = sys.modules.get(cls.__module__)
+    if module is not None:
+        module.__ENTRY_CLASS__ = cls
+    return cls
+
 def hook(hook_name: str) -> Callable:
     """Decorator to register a method as a hook callback.
     
@@ -7,50 +7,77 @@ with Open WebUI at specific points.
 
 import inspect
 import logging
-from typing import Any, Callable, Dict, List, Optional, Set
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger("webui-extensions.hooks")
 
-# Dictionary mapping hook names to registered callbacks
-_hook_registry: Dict[str, List[Callable]] = {}
+# Dictionary mapping hook names to registered callbacks. Callbacks are
+# stored as immutable tuples swapped atomically under _write_lock, so
+# dispatch can iterate without taking any lock.
+_hook_registry: Dict[str, Tuple[Callable, ...]] = {}
 
 # Set of hooks that have been registered
 _registered_hooks: Set[str] = set()
 
+# Serializes registration/clearing; the read path never acquires it
+_write_lock = threading.Lock()
+
 def register_hook(hook_name: str) -> None:
     """Register a hook.
-    
+
     Args:
         hook_name: The name of the hook.
     """
-    if hook_name not in _registered_hooks:
-        _registered_hooks.add(hook_name)
-        _hook_registry[hook_name] = []
-        logger.info(f"Registered hook: {hook_name}")
+    with _write_lock:
+        if hook_name not in _registered_hooks:
+            _registered_hooks.add(hook_name)
+            _hook_registry[hook_name] = ()
+            logger.info(f"Registered hook: {hook_name}")
 
 def register_callback(hook_name: str, callback: Callable) -> None:
     """Register a callback for a hook.
-    
+
     Args:
         hook_name: The name of the hook.
         callback: The callback function.
     """
     if hook_name not in _registered_hooks:
         register_hook(hook_name)
-    
-    if callback not in _hook_registry[hook_name]:
-        _hook_registry[hook_name].append(callback)
-        logger.info(f"Registered callback for hook: {hook_name}")
+
+    with _write_lock:
+        callbacks = _hook_registry[hook_name]
+        if callback not in callbacks:
+            # Copy-on-write: readers keep iterating their old tuple
+            _hook_registry[hook_name] = callbacks + (callback,)
+            logger.info(f"Registered callback for hook: {hook_name}")
+
+def has_listeners(hook_name: str) -> bool:
+    """Check whether any callback is registered for a hook.
+
+    Cheap synchronous gate so hot paths can skip the work of preparing
+    hook input (e.g. buffering a request body) when nothing listens.
+
+    Args:
+        hook_name: The name of the hook.
+
+    Returns:
+        True if at least one callback is registered.
+    """
+    return bool(_hook_registry.get(hook_name))
 
 async def execute_hook(hook_name: str, data: Any = None) -> Any:
     """Execute a hook with the given data.
-    
+
     Args:
         hook_name: The name of the hook.
         data: The data to pass to the callbacks.
-        
+
     Returns:
-        The result of the hook execution.
+        The result of the hook execution. When no callback modifies the
+        data, the original object is returned unchanged, so callers can
+        detect "no modification" with an identity check instead of
+        comparing contents.
     """
     if hook_name not in _registered_hooks:
         logger.debug(f"No callbacks registered for hook: {hook_name}")
@@ -91,8 +118,8 @@ def get_callbacks_for_hook(hook_name: str) -> List[Callable]:
     """
     if hook_name not in _registered_hooks:
         return []
-    
-    return _hook_registry[hook_name].copy()
+
+    return list(_hook_registry[hook_name])
 
 def clear_hook_callbacks(hook_name: str) -> None:
     """Clear all callbacks for a hook.
@@ -100,15 +127,17 @@ def clear_hook_callbacks(hook_name: str) -> None:
     Args:
         hook_name: The name of the hook.
     """
-    if hook_name in _registered_hooks:
-        _hook_registry[hook_name] = []
-        logger.info(f"Cleared callbacks for hook: {hook_name}")
+    with _write_lock:
+        if hook_name in _registered_hooks:
+            _hook_registry[hook_name] = ()
+            logger.info(f"Cleared callbacks for hook: {hook_name}")
 
 def clear_all_hooks() -> None:
     """Clear all hooks and callbacks."""
     global _hook_registry, _registered_hooks
-    _hook_registry = {}
-    _registered_hooks = set()
+    with _write_lock:
+        _hook_registry = {}
+        _registered_hooks = set()
     logger.info("Cleared all hooks and callbacks")
 
 def register_hooks_from_instance(instance: Any) -> None:
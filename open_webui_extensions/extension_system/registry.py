@@ -6,14 +6,19 @@ import os
 import json
 import logging
 import datetime
+import shutil
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, Type
 import threading
 
 from .base import Extension
+from ._json import loads as json_loads, dumps as json_dumps
 from .utils import (
+    find_entry_point,
     load_extension,
     discover_extensions,
+    discover_extension_metadata,
     install_from_directory,
     install_from_zip,
     install_from_url,
@@ -23,6 +28,14 @@ from .decorators import register_hooks_from_instance
 
 logger = logging.getLogger("webui-extensions.registry")
 
+
+def _as_primitive(value: Any) -> Any:
+    """Coerce a timestamp-like value to a JSON-native primitive."""
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return value
+
+
 class ExtensionInfo:
     """Information about an extension."""
     
@@ -42,24 +55,35 @@ class ExtensionInfo:
         self.install_date = datetime.datetime.now().isoformat()
         self.update_date = self.install_date
         self.error = None
-    
+        self._cached_dict: Optional[Dict[str, Any]] = None
+
+    def invalidate_dict_cache(self) -> None:
+        """Drop the memoized to_dict result after a mutation."""
+        self._cached_dict = None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to a dictionary."""
-        return {
+        if self._cached_dict is not None:
+            return self._cached_dict
+
+        # Keep every value a native primitive so orjson (and any other
+        # serializer) takes its fastest path with no default= callback
+        self._cached_dict = {
             "name": self.name,
             "version": self.version,
             "description": self.description,
             "author": self.author,
             "type": self.type,
-            "path": self.path,
-            "active": self.active,
+            "path": str(self.path) if self.path is not None else None,
+            "active": bool(self.active),
             "dependencies": self.dependencies,
             "settings": self.settings,
-            "install_date": self.install_date,
-            "update_date": self.update_date,
-            "error": self.error,
+            "install_date": _as_primitive(self.install_date),
+            "update_date": _as_primitive(self.update_date),
+            "error": str(self.error) if self.error is not None else None,
         }
-    
+        return self._cached_dict
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ExtensionInfo":
         """Create from a dictionary."""
@@ -155,6 +179,18 @@ class ExtensionRegistry:
             # Initialize internal state
             self.extensions: Dict[str, ExtensionInfo] = {}
             self.instances: Dict[str, Extension] = {}
+
+            # Index of active UI extension instances, maintained at the
+            # enable/disable/uninstall mutation points so the UI-component
+            # endpoint does not rescan every extension per request
+            self._active_ui_index: Dict[str, Extension] = {}
+
+            # Monotonic state version, bumped on every persisted mutation;
+            # used by the API layer to derive weak ETags. Seeded from the
+            # clock so versions never repeat across restarts — a client
+            # holding an ETag from a previous process must not get a
+            # false 304 for different content
+            self._version = time.time_ns()
             
             # Load the registry
             self._load_registry()
@@ -165,8 +201,8 @@ class ExtensionRegistry:
         """Load the registry from the registry file."""
         try:
             if os.path.exists(self.registry_file):
-                with open(self.registry_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(self.registry_file, "rb") as f:
+                    data = json_loads(f.read())
                 
                 for ext_data in data.get("extensions", {}).values():
                     info = ExtensionInfo.from_dict(ext_data)
@@ -174,8 +210,14 @@ class ExtensionRegistry:
         except Exception as e:
             logger.error(f"Error loading registry: {e}")
     
+    @property
+    def version(self) -> int:
+        """Get the monotonic registry state version."""
+        return self._version
+
     def _save_registry(self) -> None:
         """Save the registry to the registry file."""
+        self._version += 1
         try:
             data = {
                 "extensions": {
@@ -183,11 +225,28 @@ class ExtensionRegistry:
                 }
             }
             
-            with open(self.registry_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            # The registry is machine-read only: compact output writes
+            # roughly half the bytes of indented JSON
+            with open(self.registry_file, "wb") as f:
+                f.write(json_dumps(data))
         except Exception as e:
             logger.error(f"Error saving registry: {e}")
     
+    def _register_instance(self, name: str, extension: Extension) -> None:
+        """Store an extension instance, caching its UI-protocol probe.
+
+        The hasattr reflection runs once here instead of per request in
+        the UI-component endpoint.
+
+        Args:
+            name: The name of the extension.
+            extension: The extension instance.
+        """
+        extension._has_ui_components = (
+            hasattr(extension, "mount_points") and hasattr(extension, "components")
+        )
+        self.instances[name] = extension
+
     def discover(self) -> Dict[str, ExtensionInfo]:
         """Discover installed extensions.
         
@@ -195,11 +254,42 @@ class ExtensionRegistry:
             A dictionary mapping extension names to information.
         """
         with self._lock:
+            # Extensions that ship a manifest can be registered from
+            # metadata alone; their modules are imported lazily on enable
+            manifest_paths = set()
+            for meta in discover_extension_metadata(self.extensions_dir):
+                try:
+                    info = ExtensionInfo(
+                        name=meta["name"],
+                        version=meta.get("version", "0.0.0"),
+                        description=meta.get("description", ""),
+                        author=meta.get("author", ""),
+                        type=meta.get("type", "generic"),
+                        path=meta["path"],
+                        dependencies=meta.get("dependencies", []),
+                        settings=meta.get("settings", {}),
+                    )
+
+                    # Update existing extension or add new one
+                    if info.name in self.extensions:
+                        existing = self.extensions[info.name]
+                        info.active = existing.active
+                        if existing.settings:
+                            info.settings = existing.settings
+                        info.install_date = existing.install_date
+
+                    self.extensions[info.name] = info
+                    manifest_paths.add(meta["path"])
+                except Exception as e:
+                    logger.error(f"Error reading extension metadata from {meta.get('path')}: {e}")
+
             # Discover extension paths
             extension_paths = discover_extensions(self.extensions_dir)
-            
-            # Load extensions from paths
+
+            # Load extensions from paths (legacy extensions without a manifest)
             for path in extension_paths:
+                if os.path.dirname(path) in manifest_paths:
+                    continue
                 try:
                     extension = load_extension(path)
                     if extension is not None:
@@ -213,7 +303,7 @@ class ExtensionRegistry:
                             info.install_date = existing.install_date
                         
                         self.extensions[info.name] = info
-                        self.instances[info.name] = extension
+                        self._register_instance(info.name, extension)
                 except Exception as e:
                     logger.error(f"Error loading extension from {path}: {e}")
             
@@ -293,15 +383,7 @@ class ExtensionRegistry:
                     return False, None, f"Invalid extension source: {source}"
                 
                 # Find the extension entry point
-                entry_point = None
-                if os.path.isfile(os.path.join(install_path, "__init__.py")):
-                    entry_point = os.path.join(install_path, "__init__.py")
-                else:
-                    for file in ["extension.py", "main.py"]:
-                        if os.path.isfile(os.path.join(install_path, file)):
-                            entry_point = os.path.join(install_path, file)
-                            break
-                
+                entry_point = find_entry_point(install_path)
                 if not entry_point:
                     return False, None, f"Could not find extension entry point in {install_path}"
                 
@@ -315,7 +397,7 @@ class ExtensionRegistry:
                 
                 # Update registry
                 self.extensions[info.name] = info
-                self.instances[info.name] = extension
+                self._register_instance(info.name, extension)
                 
                 # Save registry
                 self._save_registry()
@@ -353,13 +435,13 @@ class ExtensionRegistry:
                 
                 # Remove the extension directory
                 if info.path and os.path.exists(info.path):
-                    import shutil
                     shutil.rmtree(info.path)
                 
                 # Remove from registry
                 del self.extensions[name]
                 if name in self.instances:
                     del self.instances[name]
+                self._active_ui_index.pop(name, None)
                 
                 # Save registry
                 self._save_registry()
@@ -398,23 +480,15 @@ class ExtensionRegistry:
                     if not info.path:
                         return False, f"Extension {name} has no path"
                     
-                    entry_point = None
-                    if os.path.isfile(os.path.join(info.path, "__init__.py")):
-                        entry_point = os.path.join(info.path, "__init__.py")
-                    else:
-                        for file in ["extension.py", "main.py"]:
-                            if os.path.isfile(os.path.join(info.path, file)):
-                                entry_point = os.path.join(info.path, file)
-                                break
-                    
+                    entry_point = find_entry_point(info.path)
                     if not entry_point:
                         return False, f"Could not find extension entry point in {info.path}"
                     
                     extension = load_extension(entry_point)
                     if not extension:
                         return False, f"Failed to load extension from {entry_point}"
-                    
-                    self.instances[name] = extension
+
+                    self._register_instance(name, extension)
                 
                 # Get the extension instance
                 extension = self.instances[name]
@@ -447,7 +521,10 @@ class ExtensionRegistry:
                     # Update extension status
                     info.active = True
                     info.error = None
-                    
+                    info.invalidate_dict_cache()
+                    if extension.type == "ui":
+                        self._active_ui_index[name] = extension
+
                     # Save registry
                     self._save_registry()
                     
@@ -455,6 +532,7 @@ class ExtensionRegistry:
                 except Exception as e:
                     logger.error(f"Error enabling extension {name}: {e}")
                     info.error = str(e)
+                    info.invalidate_dict_cache()
                     self._save_registry()
                     return False, f"Error enabling extension: {e}"
             except Exception as e:
@@ -506,7 +584,9 @@ class ExtensionRegistry:
                 
                 # Update extension status
                 info.active = False
-                
+                info.invalidate_dict_cache()
+                self._active_ui_index.pop(name, None)
+
                 # Save registry
                 self._save_registry()
                 
@@ -541,6 +621,8 @@ class ExtensionRegistry:
                     if key in info.settings:
                         info.settings[key]["value"] = value
                 
+                info.invalidate_dict_cache()
+
                 # Update extension instance
                 if name in self.instances:
                     extension = self.instances[name]
@@ -556,6 +638,58 @@ class ExtensionRegistry:
                 logger.error(f"Error updating settings for {name}: {e}")
                 return False, f"Error updating settings: {e}"
     
+    def iter_active_ui(self) -> List[Tuple[str, Extension]]:
+        """Get the active UI extension instances.
+
+        Returns:
+            A list of (name, instance) pairs from the maintained index.
+        """
+        with self._lock:
+            return list(self._active_ui_index.items())
+
+    def list_active_names(self) -> List[str]:
+        """List the names of extensions marked active.
+
+        Returns:
+            A list of extension names.
+        """
+        with self._lock:
+            if not self.extensions:
+                self.discover()
+            return [name for name, info in self.extensions.items() if info.active]
+
+    def initialize_one(self, name: str) -> Tuple[bool, str]:
+        """Initialize and enable a single extension.
+
+        The extension module is imported outside the registry lock, so
+        several extensions can be initialized concurrently from a thread
+        pool without serializing their import and setup I/O.
+
+        Args:
+            name: The name of the extension.
+
+        Returns:
+            A tuple containing:
+            - A boolean indicating success or failure.
+            - A message describing the result.
+        """
+        info = self.get_extension_info(name)
+        if info is None:
+            return False, f"Extension {name} not found"
+
+        # Pre-load the module outside the lock; enable_extension will pick
+        # up the cached instance
+        if name not in self.instances and info.path:
+            entry_point = find_entry_point(info.path)
+            if entry_point:
+                extension = load_extension(entry_point)
+                if extension:
+                    with self._lock:
+                        if name not in self.instances:
+                            self._register_instance(name, extension)
+
+        return self.enable_extension(name)
+
     def initialize_all(self) -> Dict[str, Tuple[bool, str]]:
         """Initialize all extensions.
         
@@ -4,22 +4,38 @@ Utility functions for the extension system.
 
 import os
 import sys
+import functools
 import importlib.util
 import inspect
 import logging
-import yaml
 import json
+import itertools
 import shutil
 import tempfile
-import zipfile
-import requests
+import threading
+import weakref
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, Type
 
 from .base import Extension
+from ._json import loads as json_loads, dumps as json_dumps
+
+# requests, yaml and zipfile are imported lazily inside the functions that
+# need them: a warm registry listing/enabling extensions never touches
+# them, and importing this module should not pay for urllib3/SSL setup or
+# PyYAML's parser tables.
 
 logger = logging.getLogger("webui-extensions.utils")
 
+def _import_yaml():
+    """Import PyYAML and pick the fastest available safe loader."""
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return yaml, loader
+
 def setup_extensions_directory(directory_path: str) -> str:
     """Set up the extensions directory.
     
@@ -41,11 +57,29 @@ def setup_extensions_directory(directory_path: str) -> str:
     # Create an empty registry file if it doesn't exist
     registry_file = directory / "registry.json"
     if not registry_file.exists():
-        with open(registry_file, "w", encoding="utf-8") as f:
-            json.dump({"extensions": {}}, f, indent=2)
+        with open(registry_file, "wb") as f:
+            f.write(json_dumps({"extensions": {}}))
     
     return str(directory)
 
+# Entry-point filenames in priority order, shared by every resolver
+_ENTRY_NAMES = ("__init__.py", "extension.py", "main.py")
+
+def find_entry_point(directory: str) -> Optional[str]:
+    """Find an extension's entry-point file in a directory.
+
+    Args:
+        directory: The extension directory.
+
+    Returns:
+        The path to the entry-point file, or None if not found.
+    """
+    for fname in _ENTRY_NAMES:
+        path = os.path.join(directory, fname)
+        if os.path.isfile(path):
+            return path
+    return None
+
 def load_extension_module(path: str) -> Optional[Any]:
     """Load an extension module from a file path.
     
@@ -70,26 +104,50 @@ def load_extension_module(path: str) -> Optional[Any]:
         logger.error(f"Failed to load extension module {path}: {e}")
         return None
 
+# Cache of discovered extension classes, keyed weakly by the module
+# object itself. Extensions share a sys.modules key, so a module object
+# can die while its class lives on; keying on the object (not its id)
+# means a dead module's entry vanishes with it instead of lingering at a
+# reusable address and resolving to another extension's class.
+_extension_class_cache: "weakref.WeakKeyDictionary[Any, Type[Extension]]" = weakref.WeakKeyDictionary()
+
 def find_extension_class(module: Any) -> Optional[Type[Extension]]:
     """Find an Extension subclass in a module.
-    
+
     Args:
         module: The module to search.
-        
+
     Returns:
         The Extension subclass, or None if not found.
     """
     try:
+        cached = _extension_class_cache.get(module)
+        if cached is not None:
+            return cached
+
+        # Declared entry class (set by @extension_entry) resolves in O(1)
+        entry_class = getattr(module, "__ENTRY_CLASS__", None)
+        if (inspect.isclass(entry_class) and
+                issubclass(entry_class, Extension) and
+                not inspect.isabstract(entry_class)):
+            _extension_class_cache[module] = entry_class
+            return entry_class
+
         # First, look for an 'extension' variable
-        if hasattr(module, "extension") and isinstance(module.extension, Extension):
-            return module.extension.__class__
-        
-        # Then look for Extension subclasses
-        for name, obj in inspect.getmembers(module):
-            if (inspect.isclass(obj) and 
-                issubclass(obj, Extension) and 
-                obj != Extension and
+        extension = getattr(module, "extension", None)
+        if isinstance(extension, Extension):
+            _extension_class_cache[module] = extension.__class__
+            return extension.__class__
+
+        # Then look for Extension subclasses. Iterating the module dict
+        # directly avoids the sort and per-name getattr (and any module
+        # __getattr__) that inspect.getmembers performs.
+        for name, obj in module.__dict__.items():
+            if (isinstance(obj, type) and
+                issubclass(obj, Extension) and
+                obj is not Extension and
                 not inspect.isabstract(obj)):
+                _extension_class_cache[module] = obj
                 return obj
         
         logger.warning(f"No Extension subclass found in module {module.__name__}")
@@ -109,9 +167,10 @@ def get_extension_instance(module: Any) -> Optional[Extension]:
     """
     try:
         # First, look for an 'extension' variable
-        if hasattr(module, "extension") and isinstance(module.extension, Extension):
-            return module.extension
-        
+        extension = getattr(module, "extension", None)
+        if isinstance(extension, Extension):
+            return extension
+
         # Then look for Extension subclasses and instantiate one
         extension_class = find_extension_class(module)
         if extension_class is not None:
@@ -147,28 +206,84 @@ def discover_extensions(directory: str) -> List[str]:
         A list of paths to extension modules.
     """
     extension_paths = []
-    
+
     try:
-        installed_dir = Path(directory) / "installed"
-        if not installed_dir.exists():
-            installed_dir.mkdir(parents=True, exist_ok=True)
-        
-        for ext_dir in installed_dir.iterdir():
-            if ext_dir.is_dir():
-                init_py = ext_dir / "__init__.py"
-                if init_py.exists():
-                    extension_paths.append(str(init_py))
-                else:
-                    # Look for main module file
-                    for file in ext_dir.glob("*.py"):
-                        if file.name in ["extension.py", "main.py", f"{ext_dir.name}.py"]:
-                            extension_paths.append(str(file))
-                            break
+        installed_dir = os.path.join(directory, "installed")
+        if not os.path.isdir(installed_dir):
+            os.makedirs(installed_dir, exist_ok=True)
+
+        # A single scandir per directory keeps this to one getdents-backed
+        # pass instead of a stat() call per candidate file.
+        with os.scandir(installed_dir) as it:
+            for ext_dir in it:
+                if not ext_dir.is_dir(follow_symlinks=False):
+                    continue
+
+                with os.scandir(ext_dir.path) as sub:
+                    names = {entry.name for entry in sub if entry.is_file()}
+
+                # Check entry points in priority order
+                for candidate in _ENTRY_NAMES + (f"{ext_dir.name}.py",):
+                    if candidate in names:
+                        extension_paths.append(os.path.join(ext_dir.path, candidate))
+                        break
     except Exception as e:
         logger.error(f"Error discovering extensions in {directory}: {e}")
-    
+
     return extension_paths
 
+def read_extension_manifest(ext_dir: str) -> Optional[Dict[str, Any]]:
+    """Read an extension's manifest file, if present.
+
+    Args:
+        ext_dir: The extension directory.
+
+    Returns:
+        The manifest as a dictionary, or None if there is no manifest.
+    """
+    manifest_path = os.path.join(ext_dir, "manifest.json")
+    try:
+        with open(manifest_path, "rb") as f:
+            return json_loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error(f"Error reading manifest from {manifest_path}: {e}")
+        return None
+
+def discover_extension_metadata(directory: str) -> List[Dict[str, Any]]:
+    """Discover extension metadata without importing extension modules.
+
+    Extensions that ship a manifest.json can be listed from metadata alone;
+    their module code is only imported when they are enabled.
+
+    Args:
+        directory: The extensions directory.
+
+    Returns:
+        A list of metadata dictionaries, each including the extension path.
+    """
+    metadata = []
+
+    try:
+        installed_dir = os.path.join(directory, "installed")
+        if not os.path.isdir(installed_dir):
+            return metadata
+
+        with os.scandir(installed_dir) as it:
+            for ext_dir in it:
+                if not ext_dir.is_dir(follow_symlinks=False):
+                    continue
+
+                manifest = read_extension_manifest(ext_dir.path)
+                if manifest and "name" in manifest:
+                    manifest["path"] = ext_dir.path
+                    metadata.append(manifest)
+    except Exception as e:
+        logger.error(f"Error discovering extension metadata in {directory}: {e}")
+
+    return metadata
+
 def load_extension_config(path: str) -> Dict[str, Any]:
     """Load an extension configuration from a file.
     
@@ -179,25 +294,47 @@ def load_extension_config(path: str) -> Dict[str, Any]:
         The configuration as a dictionary.
     """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            if path.endswith(".yaml") or path.endswith(".yml"):
-                return yaml.safe_load(f) or {}
-            elif path.endswith(".json"):
-                return json.load(f)
-            else:
-                logger.warning(f"Unknown configuration file format: {path}")
-                return {}
+        if path.endswith(".yaml") or path.endswith(".yml"):
+            # Serve a JSON sidecar written on a previous parse when it is
+            # at least as new as the YAML source
+            cache_path = path + ".cache.json"
+            try:
+                if os.stat(cache_path).st_mtime_ns >= os.stat(path).st_mtime_ns:
+                    with open(cache_path, "rb") as f:
+                        return json_loads(f.read())
+            except OSError:
+                pass
+
+            yaml, yaml_loader = _import_yaml()
+            with open(path, "r", encoding="utf-8") as f:
+                config = yaml.load(f, Loader=yaml_loader) or {}
+
+            # Cache the parsed result so warm starts skip YAML entirely
+            try:
+                with open(cache_path, "wb") as f:
+                    f.write(json_dumps(config))
+            except (OSError, TypeError):
+                pass
+
+            return config
+        elif path.endswith(".json"):
+            with open(path, "rb") as f:
+                return json_loads(f.read())
+        else:
+            logger.warning(f"Unknown configuration file format: {path}")
+            return {}
     except Exception as e:
         logger.error(f"Error loading extension configuration from {path}: {e}")
         return {}
 
-def save_extension_config(config: Dict[str, Any], path: str) -> bool:
+def save_extension_config(config: Dict[str, Any], path: str, pretty: bool = False) -> bool:
     """Save an extension configuration to a file.
-    
+
     Args:
         config: The configuration to save.
         path: The path to save the configuration to.
-        
+        pretty: Whether to indent JSON output for human readers.
+
     Returns:
         True if the configuration was saved successfully, False otherwise.
     """
@@ -205,12 +342,16 @@ def save_extension_config(config: Dict[str, Any], path: str) -> bool:
         directory = os.path.dirname(path)
         if not os.path.exists(directory):
             os.makedirs(directory, exist_ok=True)
-        
+
         with open(path, "w", encoding="utf-8") as f:
             if path.endswith(".yaml") or path.endswith(".yml"):
+                yaml, _ = _import_yaml()
                 yaml.dump(config, f, default_flow_style=False)
             elif path.endswith(".json"):
-                json.dump(config, f, indent=2)
+                if pretty:
+                    json.dump(config, f, indent=2)
+                else:
+                    json.dump(config, f, separators=(",", ":"))
             else:
                 logger.warning(f"Unknown configuration file format: {path}")
                 return False
@@ -230,13 +371,32 @@ def download_from_url(url: str, target_path: str) -> bool:
         True if the file was downloaded successfully, False otherwise.
     """
     try:
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
-        
-        with open(target_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        
+        import requests
+
+        with requests.get(url, stream=True, timeout=(5, 30)) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+
+            with open(target_path, "wb") as f:
+                # Preallocate when the server tells us the final size.
+                # With a Content-Encoding the header describes the
+                # encoded stream, not the decoded bytes we write, so
+                # skip preallocation rather than guess
+                content_length = response.headers.get("Content-Length")
+                if (content_length
+                        and not response.headers.get("Content-Encoding")
+                        and hasattr(os, "posix_fallocate")):
+                    try:
+                        os.posix_fallocate(f.fileno(), 0, int(content_length))
+                    except (OSError, ValueError):
+                        pass
+
+                # Copy in 1 MiB chunks at the C level instead of running
+                # the iter_content generator machinery per 8 KiB chunk
+                shutil.copyfileobj(response.raw, f, 1 << 20)
+                # Drop any preallocated tail beyond what was written
+                f.truncate()
+
         return True
     except Exception as e:
         logger.error(f"Error downloading from {url}: {e}")
@@ -253,50 +413,140 @@ def extract_zip(zip_path: str, target_dir: str) -> bool:
         True if the file was extracted successfully, False otherwise.
     """
     try:
+        import zipfile
+
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(target_dir)
+            for info in zip_ref.infolist():
+                # Reject entries that would escape target_dir, the same
+                # sanitization extractall performs
+                name = info.filename
+                if name.startswith("/") or ".." in name.split("/"):
+                    logger.warning(f"Skipping unsafe ZIP entry: {name}")
+                    continue
+
+                if info.is_dir():
+                    os.makedirs(os.path.join(target_dir, name), exist_ok=True)
+                    continue
+
+                dest = os.path.join(target_dir, name)
+                os.makedirs(os.path.dirname(dest) or target_dir, exist_ok=True)
+
+                fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    # Preallocate the final size up front to reduce metadata
+                    # churn and fragmentation (not available on Windows)
+                    if info.file_size and hasattr(os, "posix_fallocate"):
+                        try:
+                            os.posix_fallocate(fd, 0, info.file_size)
+                        except OSError:
+                            pass
+                    with zip_ref.open(info) as src, os.fdopen(fd, "wb", buffering=1 << 20) as dst:
+                        fd = None
+                        shutil.copyfileobj(src, dst, 1 << 20)
+                finally:
+                    if fd is not None:
+                        os.close(fd)
         return True
     except Exception as e:
         logger.error(f"Error extracting ZIP file {zip_path}: {e}")
         return False
 
+@functools.lru_cache(maxsize=256)
+def _scan_dir_snapshot(path: str, mtime_ns: int) -> Tuple[frozenset, Tuple[str, ...]]:
+    """Scan a directory once, memoized on (path, mtime)."""
+    files = set()
+    dirs = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                dirs.append(entry.name)
+            elif entry.is_file():
+                files.add(entry.name)
+    return frozenset(files), tuple(dirs)
+
+def _dir_snapshot(path: str) -> Tuple[frozenset, Tuple[str, ...]]:
+    """Get the (files, subdirs) snapshot of a directory.
+
+    The snapshot is cached keyed on the directory's mtime, so repeated
+    probes touch the directory once instead of stat()ing each candidate
+    file separately.
+
+    Args:
+        path: The directory to scan.
+
+    Returns:
+        A tuple of (frozenset of file names, tuple of subdirectory names).
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return frozenset(), ()
+    return _scan_dir_snapshot(path, mtime_ns)
+
 def find_extension_dir(base_dir: str) -> Optional[str]:
     """Find the extension directory in a base directory.
-    
+
     This function looks for a directory containing an __init__.py file
     or other common extension entry points.
-    
+
     Args:
         base_dir: The base directory to search.
-        
+
     Returns:
         The path to the extension directory, or None if not found.
     """
-    base_path = Path(base_dir)
-    
-    # Check for __init__.py in the base directory
-    if (base_path / "__init__.py").exists():
-        return str(base_path)
-    
-    # Look for common extension entry point files
-    for file in ["extension.py", "main.py"]:
-        if (base_path / file).exists():
-            return str(base_path)
-    
-    # Look for a single subdirectory with an extension
-    subdirs = [d for d in base_path.iterdir() if d.is_dir() and not d.name.startswith(".")]
-    if len(subdirs) == 1:
-        subdir = subdirs[0]
-        if (subdir / "__init__.py").exists() or any((subdir / f).exists() for f in ["extension.py", "main.py"]):
-            return str(subdir)
-    
-    # Look for any subdirectory with an extension
-    for subdir in subdirs:
-        if (subdir / "__init__.py").exists() or any((subdir / f).exists() for f in ["extension.py", "main.py"]):
-            return str(subdir)
-    
+    files, subdirs = _dir_snapshot(base_dir)
+
+    # Check for entry point files in the base directory
+    if any(name in files for name in _ENTRY_NAMES):
+        return base_dir
+
+    # Look for a subdirectory with an extension
+    for name in subdirs:
+        if name.startswith("."):
+            continue
+        subdir = os.path.join(base_dir, name)
+        sub_files, _ = _dir_snapshot(subdir)
+        if any(entry in sub_files for entry in _ENTRY_NAMES):
+            return subdir
+
     return None
 
+def _copy_extension_tree(source_dir: str, install_dir: str) -> None:
+    """Copy an extension tree into the installed directory.
+
+    When source and target live on the same filesystem the files are
+    hardlinked instead of copied, so no data bytes move at all.
+
+    Args:
+        source_dir: The source directory.
+        install_dir: The destination directory (must not exist yet).
+    """
+    try:
+        same_device = (
+            os.name == "posix" and
+            os.stat(source_dir).st_dev == os.stat(os.path.dirname(install_dir)).st_dev
+        )
+    except OSError:
+        same_device = False
+
+    if not same_device:
+        shutil.copytree(source_dir, install_dir)
+        return
+
+    for root, dirs, files in os.walk(source_dir):
+        relative = os.path.relpath(root, source_dir)
+        dest_root = install_dir if relative == "." else os.path.join(install_dir, relative)
+        os.makedirs(dest_root, exist_ok=True)
+
+        for name in files:
+            src_path = os.path.join(root, name)
+            dst_path = os.path.join(dest_root, name)
+            try:
+                os.link(src_path, dst_path)
+            except OSError:
+                shutil.copy2(src_path, dst_path)
+
 def install_from_directory(source_dir: str, target_dir: str) -> Optional[str]:
     """Install an extension from a directory.
     
@@ -338,48 +588,222 @@ def install_from_directory(source_dir: str, target_dir: str) -> Optional[str]:
         install_dir = os.path.join(target_dir, "installed", ext_name)
         if os.path.exists(install_dir):
             logger.warning(f"Extension {ext_name} already exists, removing")
-            shutil.rmtree(install_dir)
-        
+            _remove_tree_async(install_dir)
+
         # Copy the extension
-        shutil.copytree(ext_dir, install_dir)
-        
+        _copy_extension_tree(ext_dir, install_dir)
+
         return install_dir
     except Exception as e:
         logger.error(f"Error installing from directory {source_dir}: {e}")
         return None
 
+def _find_zip_extension_root(zip_file: "zipfile.ZipFile") -> Optional[str]:
+    """Find the extension root prefix inside a ZIP archive.
+
+    Args:
+        zip_file: The open ZIP file.
+
+    Returns:
+        The archive path prefix of the extension directory (possibly empty),
+        or None if no entry point was found.
+    """
+    entry_points = ("__init__.py", "extension.py", "main.py")
+    best_prefix = None
+
+    for info in zip_file.infolist():
+        name = info.filename
+        if info.is_dir() or name.startswith("__MACOSX/"):
+            continue
+
+        prefix, _, basename = name.rpartition("/")
+        if basename in entry_points:
+            # Prefer the shallowest entry point in the archive
+            if best_prefix is None or len(prefix) < len(best_prefix):
+                best_prefix = prefix
+
+    return best_prefix
+
+_trash_counter = itertools.count()
+
+def _remove_tree_async(path: str) -> None:
+    """Remove a directory tree without blocking the caller.
+
+    The tree is renamed to a unique sibling first (cheap and atomic), so
+    the path is immediately free for reuse; the recursive unlink then
+    runs in a background thread.
+
+    Args:
+        path: The directory to remove.
+    """
+    trash = f"{path}.old.{os.getpid()}.{next(_trash_counter)}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+
+    threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}, daemon=True
+    ).start()
+
+def _zip_entries_look_valid(zip_file: "zipfile.ZipFile") -> bool:
+    """Cheaply sanity-check a ZIP's central directory before extraction.
+
+    Args:
+        zip_file: The open ZIP file.
+
+    Returns:
+        False if any entry's local header lies outside the archive,
+        which means the archive is truncated or malformed.
+    """
+    try:
+        fp = zip_file.fp
+        pos = fp.tell()
+        size = fp.seek(0, 2)
+        fp.seek(pos)
+    except (AttributeError, OSError):
+        # Non-seekable source; let extraction surface any errors
+        return True
+
+    for info in zip_file.infolist():
+        if info.header_offset < 0 or info.header_offset >= size:
+            return False
+
+    return True
+
+def _install_from_zipfile(zip_file: "zipfile.ZipFile", target_dir: str) -> Optional[str]:
+    """Install an extension from an open ZIP file.
+
+    Entries are streamed directly into the installed directory, so the
+    archive contents are written to disk exactly once.
+
+    Args:
+        zip_file: The open ZIP file.
+        target_dir: The target directory.
+
+    Returns:
+        The path to the installed extension, or None if installation failed.
+    """
+    # Reject malformed or entry-point-less archives before decompressing
+    # anything: both checks cost O(central directory) only
+    if not _zip_entries_look_valid(zip_file):
+        logger.error("ZIP archive is malformed or truncated")
+        return None
+
+    # Find the extension root inside the archive
+    prefix = _find_zip_extension_root(zip_file)
+    if prefix is None:
+        logger.error("No extension entry point found in ZIP archive")
+        return None
+
+    # Peek at the manifest through the same handle: the central directory
+    # is already parsed, and a manifest name lets us skip importing the
+    # extension module just to learn its name
+    ext_name = None
+    manifest_name = f"{prefix}/manifest.json" if prefix else "manifest.json"
+    try:
+        manifest = json.loads(zip_file.read(manifest_name))
+        ext_name = manifest.get("name")
+    except KeyError:
+        pass
+    except Exception as e:
+        logger.warning(f"Could not read manifest from ZIP archive: {e}")
+
+    # Stream entries into a staging directory inside installed/ so the
+    # final move is an atomic rename on the same filesystem. The name is
+    # unique per call, not just per pid: installs run on the threadpool
+    # and two concurrent ones must never share a staging path
+    installed_dir = os.path.join(target_dir, "installed")
+    os.makedirs(installed_dir, exist_ok=True)
+    staging_dir = tempfile.mkdtemp(prefix=".staging_", dir=installed_dir)
+
+    try:
+        strip = len(prefix) + 1 if prefix else 0
+        for info in zip_file.infolist():
+            name = info.filename
+            if info.is_dir() or name.startswith("__MACOSX/"):
+                continue
+            if prefix and not name.startswith(prefix + "/"):
+                continue
+
+            relative = name[strip:]
+            if not relative or relative.startswith("/") or ".." in relative.split("/"):
+                continue
+
+            dest = os.path.join(staging_dir, *relative.split("/"))
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+
+            # Write to a .part file and rename so readers never see
+            # partially written files
+            with zip_file.open(info) as src, open(dest + ".part", "wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+            os.replace(dest + ".part", dest)
+
+        # Without a manifest name, load the extension to get its name
+        if ext_name is None:
+            ext_path = find_entry_point(staging_dir)
+            if ext_path is None:
+                logger.error("No extension entry point found after extraction")
+                return None
+
+            extension = load_extension(ext_path)
+            if extension is None:
+                logger.error(f"Failed to load extension from {ext_path}")
+                return None
+
+            ext_name = extension.name
+
+        # Move the staged tree into place
+        install_dir = os.path.join(installed_dir, ext_name)
+        if os.path.exists(install_dir):
+            logger.warning(f"Extension {ext_name} already exists, removing")
+            _remove_tree_async(install_dir)
+        os.replace(staging_dir, install_dir)
+
+        return install_dir
+    finally:
+        if os.path.exists(staging_dir):
+            shutil.rmtree(staging_dir)
+
 def install_from_zip(zip_path: str, target_dir: str) -> Optional[str]:
     """Install an extension from a ZIP file.
-    
+
     Args:
         zip_path: The path to the ZIP file.
         target_dir: The target directory.
-        
+
     Returns:
         The path to the installed extension, or None if installation failed.
     """
     try:
-        # Create a temporary directory for extraction
-        temp_dir = os.path.join(target_dir, "temp", f"extract_{os.path.basename(zip_path)}")
-        if os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir)
-        os.makedirs(temp_dir, exist_ok=True)
-        
-        # Extract the ZIP file
-        if not extract_zip(zip_path, temp_dir):
-            return None
-        
-        # Install from the extracted directory
-        result = install_from_directory(temp_dir, target_dir)
-        
-        # Clean up
-        shutil.rmtree(temp_dir)
-        
-        return result
+        import zipfile
+
+        with zipfile.ZipFile(zip_path, "r") as zip_file:
+            return _install_from_zipfile(zip_file, target_dir)
     except Exception as e:
         logger.error(f"Error installing from ZIP {zip_path}: {e}")
         return None
 
+def install_from_zip_fileobj(fileobj: Any, target_dir: str) -> Optional[str]:
+    """Install an extension from a file-like object containing a ZIP archive.
+
+    Args:
+        fileobj: A seekable binary file-like object.
+        target_dir: The target directory.
+
+    Returns:
+        The path to the installed extension, or None if installation failed.
+    """
+    try:
+        import zipfile
+
+        with zipfile.ZipFile(fileobj) as zip_file:
+            return _install_from_zipfile(zip_file, target_dir)
+    except Exception as e:
+        logger.error(f"Error installing from ZIP stream: {e}")
+        return None
+
 def install_from_url(url: str, target_dir: str) -> Optional[str]:
     """Install an extension from a URL.
     
@@ -391,26 +815,26 @@ def install_from_url(url: str, target_dir: str) -> Optional[str]:
         The path to the installed extension, or None if installation failed.
     """
     try:
-        # Create a temporary file for download
-        temp_file = os.path.join(target_dir, "temp", f"download_{os.path.basename(url)}")
-        os.makedirs(os.path.dirname(temp_file), exist_ok=True)
-        
-        # Download the file
-        if not download_from_url(url, temp_file):
-            return None
-        
-        # If it's a ZIP file, install from ZIP
-        if url.endswith(".zip") or zipfile.is_zipfile(temp_file):
-            result = install_from_zip(temp_file, target_dir)
-        else:
+        import requests
+        import zipfile
+
+        # Download into a spooled buffer: small archives stay entirely in
+        # memory, larger ones spill to an anonymous temp file
+        with tempfile.SpooledTemporaryFile(max_size=16 << 20) as buf:
+            with requests.get(url, stream=True, timeout=(5, 30)) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, buf, 1 << 20)
+
+            buf.seek(0)
+
+            # If it's a ZIP file, install from the buffer
+            if url.endswith(".zip") or zipfile.is_zipfile(buf):
+                buf.seek(0)
+                return install_from_zip_fileobj(buf, target_dir)
+
             logger.error(f"Unsupported file type: {url}")
-            result = None
-        
-        # Clean up
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
-        
-        return result
+            return None
     except Exception as e:
         logger.error(f"Error installing from URL {url}: {e}")
         return None
@@ -5,6 +5,7 @@ Script to install the extension system into Open WebUI.
 
 import os
 import sys
+import json
 import importlib.util
 import logging
 from pathlib import Path
@@ -13,46 +14,91 @@ from typing import Optional, Any
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("webui-extensions.installer")
 
+def _main_path_cache_file() -> str:
+    """Get the path of the cached main.py location file."""
+    return os.path.join(
+        os.path.expanduser("~"), ".cache", "openwebui_extensions", "app_path.json"
+    )
+
+def _load_cached_main_path() -> Optional[str]:
+    """Load the cached Open WebUI main.py path, if still valid."""
+    try:
+        with open(_main_path_cache_file(), "r", encoding="utf-8") as f:
+            main_path = json.load(f).get("main_path")
+        if main_path and os.path.exists(main_path):
+            return main_path
+    except Exception:
+        pass
+    return None
+
+def _save_cached_main_path(main_path: str) -> None:
+    """Remember a resolved main.py path for the next run."""
+    try:
+        cache_file = _main_path_cache_file()
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {"main_path": main_path, "mtime": os.stat(main_path).st_mtime_ns}, f
+            )
+    except Exception as e:
+        logger.debug(f"Could not cache Open WebUI path: {e}")
+
+def _load_app_from_main(main_path: str) -> Optional[Any]:
+    """Load main.py from a path and return its FastAPI app, if any."""
+    spec = importlib.util.spec_from_file_location("open_webui.main", main_path)
+    main = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(main)
+
+    if hasattr(main, "app"):
+        logger.info("Found FastAPI app in Open WebUI main module")
+        return main.app
+
+    logger.warning("FastAPI app not found in Open WebUI main module")
+    return None
+
 def find_openwebui_app() -> Optional[Any]:
     """
     Find the Open WebUI FastAPI application.
-    
+
     Returns:
         The FastAPI app object, or None if not found.
     """
+    # Method 0: Use the path cached by a previous successful resolution
+    cached_path = _load_cached_main_path()
+    if cached_path:
+        try:
+            logger.info(f"Using cached Open WebUI main module at {cached_path}")
+            app = _load_app_from_main(cached_path)
+            if app is not None:
+                return app
+        except Exception as e:
+            logger.error(f"Error loading cached Open WebUI path {cached_path}: {e}")
+
     # Method 1: Try to find Open WebUI package
     try:
         openwebui_spec = importlib.util.find_spec("open_webui")
         if openwebui_spec:
             logger.info(f"Found Open WebUI package at {openwebui_spec.origin}")
-            
+
             # Load the main module
             main_path = os.path.join(os.path.dirname(openwebui_spec.origin), "main.py")
             if os.path.exists(main_path):
                 logger.info(f"Found Open WebUI main module at {main_path}")
-                
-                # Import the main module
-                spec = importlib.util.spec_from_file_location("open_webui.main", main_path)
-                main = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(main)
-                
-                # Get the FastAPI app
-                if hasattr(main, "app"):
-                    logger.info("Found FastAPI app in Open WebUI main module")
-                    return main.app
-                else:
-                    logger.warning("FastAPI app not found in Open WebUI main module")
+                app = _load_app_from_main(main_path)
+                if app is not None:
+                    _save_cached_main_path(main_path)
+                    return app
     except Exception as e:
         logger.error(f"Error finding Open WebUI package: {e}")
-    
-    # Method 2: Try to find common Open WebUI installation paths
+
+    # Method 2: Fall back to scanning common Open WebUI installation paths
     common_paths = [
         "/usr/local/lib/python3.*/site-packages/open_webui/main.py",
         "/usr/lib/python3.*/site-packages/open_webui/main.py",
         os.path.expanduser("~/.local/lib/python3.*/site-packages/open_webui/main.py"),
         os.path.expanduser("~/venv/lib/python3.*/site-packages/open_webui/main.py"),
     ]
-    
+
     for path_pattern in common_paths:
         try:
             import glob
@@ -60,21 +106,13 @@ def find_openwebui_app() -> Optional[Any]:
             if matching_paths:
                 main_path = matching_paths[0]
                 logger.info(f"Found Open WebUI main module at {main_path}")
-                
-                # Import the main module
-                spec = importlib.util.spec_from_file_location("open_webui.main", main_path)
-                main = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(main)
-                
-                # Get the FastAPI app
-                if hasattr(main, "app"):
-                    logger.info("Found FastAPI app in Open WebUI main module")
-                    return main.app
-                else:
-                    logger.warning("FastAPI app not found in Open WebUI main module")
+                app = _load_app_from_main(main_path)
+                if app is not None:
+                    _save_cached_main_path(main_path)
+                    return app
         except Exception as e:
             logger.error(f"Error checking {path_pattern}: {e}")
-    
+
     logger.error("Could not find Open WebUI FastAPI app")
     return None
 
@@ -2,35 +2,122 @@
 API endpoints for the extension manager.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query, Body, Request
-from typing import Any, Dict, List, Optional
+import asyncio
+import functools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from starlette.concurrency import run_in_threadpool
+
+from fastapi import APIRouter, HTTPException, Depends, Query, Body, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional, Tuple
+
+from open_webui_extensions.extension_system._json import loads as json_loads, dumps as json_dumps
+
+# Serialize responses with orjson when it is installed; it is several
+# times faster than the stdlib encoder FastAPI uses by default
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultJSONResponse
+
+# Optional msgpack output for bandwidth-constrained polling clients;
+# payloads are noticeably smaller than JSON for dict-heavy content
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 from open_webui_extensions.extension_system.registry import ExtensionRegistry
 from open_webui_extensions.extension_system.hooks import execute_hook
 
+logger = logging.getLogger("webui-extensions.api")
+
+# Rendered-component cache: (ext_name, component_id) -> (registry version,
+# render time, entry). Keying on the registry version busts it on any
+# enable/disable/settings mutation; the TTL bounds staleness for renderers
+# whose output drifts without a registry change.
+_component_cache: Dict[Tuple[str, str], Tuple[int, float, Dict[str, Any]]] = {}
+_COMPONENT_CACHE_TTL = 30.0
+
+
+def _negotiated_response(request: Request, payload: Dict[str, Any],
+                         headers: Optional[Dict[str, str]] = None):
+    """Serialize a payload honoring msgpack content negotiation.
+
+    Args:
+        request: The incoming request, checked for an msgpack Accept header.
+        payload: The response payload.
+        headers: Optional extra response headers.
+
+    Returns:
+        A msgpack Response when requested and available, otherwise JSON.
+    """
+    if msgpack is not None and "application/x-msgpack" in request.headers.get("accept", ""):
+        return Response(
+            msgpack.packb(payload, use_bin_type=True),
+            media_type="application/x-msgpack",
+            headers=headers,
+        )
+    return DefaultJSONResponse(payload, headers=headers)
 
+
+class NameBody(BaseModel):
+    """Request body carrying an extension name."""
+
+    name: str
+
+
+class SourceBody(BaseModel):
+    """Request body carrying an extension source (path or URL)."""
+
+    source: str
+
+
+class SettingsBody(BaseModel):
+    """Request body for updating extension settings."""
+
+    name: str
+    settings: Dict[str, Any]
+
+
+# Cached per registry instance: route registration is the expensive part,
+# and re-initializations (tests, --reload) reuse the built router
+@functools.lru_cache(maxsize=None)
 def create_router(registry: ExtensionRegistry) -> APIRouter:
     """Create the API router for the extension manager.
-    
+
     Args:
         registry: The extension registry.
-        
+
     Returns:
         The API router.
     """
-    router = APIRouter()
+    router = APIRouter(default_response_class=DefaultJSONResponse)
     
     # Handle root endpoint both with and without trailing slash
     @router.get("")
     @router.get("/")
-    async def list_extensions():
+    async def list_extensions(request: Request):
         """List all extensions."""
         try:
-            extensions = registry.list_extensions()
-            return {
+            # A weak ETag from the registry version lets unchanged polls
+            # return an empty 304 with no serialization at all
+            etag = f'W/"{registry.version}"'
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers={"ETag": etag})
+
+            extensions = await run_in_threadpool(registry.list_extensions)
+            # Build the response directly to bypass jsonable_encoder on
+            # this frequently polled endpoint
+            return _negotiated_response(request, {
                 "success": True,
                 "extensions": [ext.to_dict() for ext in extensions],
-            }
+            }, headers={"ETag": etag, "Cache-Control": "max-age=5"})
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -40,115 +127,116 @@ def create_router(registry: ExtensionRegistry) -> APIRouter:
         try:
             extension = registry.get_extension_info(name)
             if not extension:
-                return {
+                return DefaultJSONResponse({
                     "success": False,
                     "message": f"Extension {name} not found",
-                }
+                })
             
-            return {
+            return DefaultJSONResponse({
                 "success": True,
                 "extension": extension.to_dict(),
-            }
+            })
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
     @router.post("/install")
-    async def install_extension(source: str = Body(..., embed=True)):
+    async def install_extension(body: SourceBody):
         """Install an extension."""
         try:
-            success, name, message = registry.install_extension(source)
+            success, name, message = await run_in_threadpool(
+                registry.install_extension, body.source
+            )
             
             if success and name:
                 extension = registry.get_extension_info(name)
-                return {
+                return DefaultJSONResponse({
                     "success": success,
                     "message": message,
                     "extension": extension.to_dict() if extension else None,
-                }
+                })
             else:
-                return {
+                return DefaultJSONResponse({
                     "success": success,
                     "message": message,
-                }
+                })
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
     @router.post("/uninstall")
-    async def uninstall_extension(name: str = Body(..., embed=True)):
+    async def uninstall_extension(body: NameBody):
         """Uninstall an extension."""
         try:
-            success, message = registry.uninstall_extension(name)
+            success, message = await run_in_threadpool(registry.uninstall_extension, body.name)
             
-            return {
+            return DefaultJSONResponse({
                 "success": success,
                 "message": message,
-            }
+            })
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
     @router.post("/enable")
-    async def enable_extension(name: str = Body(..., embed=True)):
+    async def enable_extension(body: NameBody):
         """Enable an extension."""
         try:
-            success, message = registry.enable_extension(name)
+            success, message = await run_in_threadpool(registry.enable_extension, body.name)
             
             if success:
-                extension = registry.get_extension_info(name)
-                return {
+                extension = registry.get_extension_info(body.name)
+                return DefaultJSONResponse({
                     "success": success,
                     "message": message,
                     "extension": extension.to_dict() if extension else None,
-                }
+                })
             else:
-                return {
+                return DefaultJSONResponse({
                     "success": success,
                     "message": message,
-                }
+                })
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
     @router.post("/disable")
-    async def disable_extension(name: str = Body(..., embed=True)):
+    async def disable_extension(body: NameBody):
         """Disable an extension."""
         try:
-            success, message = registry.disable_extension(name)
+            success, message = await run_in_threadpool(registry.disable_extension, body.name)
             
             if success:
-                extension = registry.get_extension_info(name)
-                return {
+                extension = registry.get_extension_info(body.name)
+                return DefaultJSONResponse({
                     "success": success,
                     "message": message,
                     "extension": extension.to_dict() if extension else None,
-                }
+                })
             else:
-                return {
+                return DefaultJSONResponse({
                     "success": success,
                     "message": message,
-                }
+                })
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
     @router.post("/settings")
-    async def update_settings(
-        name: str = Body(...),
-        settings: Dict[str, Any] = Body(...),
-    ):
+    async def update_settings(body: SettingsBody):
         """Update extension settings."""
         try:
-            success, message = registry.update_extension_settings(name, settings)
+            success, message = await run_in_threadpool(
+                registry.update_extension_settings, body.name, body.settings
+            )
             
             if success:
-                extension = registry.get_extension_info(name)
-                return {
+                extension = registry.get_extension_info(body.name)
+                return DefaultJSONResponse({
                     "success": success,
                     "message": message,
                     "extension": extension.to_dict() if extension else None,
-                }
+                })
             else:
-                return {
+                return DefaultJSONResponse({
                     "success": success,
                     "message": message,
-                }
+                })
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -156,13 +244,13 @@ def create_router(registry: ExtensionRegistry) -> APIRouter:
     async def discover_extensions():
         """Discover installed extensions."""
         try:
-            extensions = registry.discover()
+            extensions = await run_in_threadpool(registry.discover)
             
-            return {
+            return DefaultJSONResponse({
                 "success": True,
                 "message": f"Discovered {len(extensions)} extensions",
                 "extensions": [ext.to_dict() for ext in extensions.values()],
-            }
+            })
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -170,69 +258,120 @@ def create_router(registry: ExtensionRegistry) -> APIRouter:
     async def initialize_extensions():
         """Initialize all extensions."""
         try:
-            results = registry.initialize_all()
-            
+            names = await run_in_threadpool(registry.list_active_names)
+
+            if names:
+                # Initialize concurrently: each extension's import and
+                # setup I/O overlaps instead of running back-to-back
+                loop = asyncio.get_running_loop()
+                with ThreadPoolExecutor(max_workers=min(32, len(names))) as executor:
+                    outcomes = await asyncio.gather(*[
+                        loop.run_in_executor(executor, registry.initialize_one, name)
+                        for name in names
+                    ])
+                results = dict(zip(names, outcomes))
+            else:
+                results = {}
+
             # Count successes and failures
             successes = sum(1 for success, _ in results.values() if success)
             failures = len(results) - successes
             
-            return {
+            return DefaultJSONResponse({
                 "success": failures == 0,
                 "message": f"Initialized {successes} extensions successfully, {failures} failed",
                 "results": {name: {"success": success, "message": message} for name, (success, message) in results.items()},
-            }
+            })
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
     @router.get("/ui-components")
-    async def get_ui_components():
+    async def get_ui_components(request: Request):
         """Get UI components from all extensions."""
         try:
             # Organize components by mount point
             mount_points = {}
-            
-            # Get all active extensions
-            extensions = [ext for ext in registry.list_extensions() if ext.active]
-            
-            for ext_info in extensions:
-                # Get the extension instance
-                extension = registry.get_extension_instance(ext_info.name)
-                
-                # Skip non-UI extensions
-                if not extension or extension.type != "ui":
-                    continue
-                
-                # Get the mount points and components
-                if hasattr(extension, "mount_points") and hasattr(extension, "components"):
+
+            # Collect every renderer first so they can run concurrently;
+            # any I/O a renderer does then overlaps instead of summing
+            render_jobs = []
+            reg_version = registry.version
+            now = time.monotonic()
+
+            # The registry maintains the active-UI index at its mutation
+            # points, so there is no per-request filter over all extensions
+            for ext_name, extension in registry.iter_active_ui():
+                # UI-protocol capability is probed once at registration
+                if getattr(extension, "_has_ui_components", False):
                     for mount_point, components in extension.mount_points.items():
                         if mount_point not in mount_points:
                             mount_points[mount_point] = []
-                        
+
                         for component_id in components:
                             if component_id in extension.components:
                                 # Get the component renderer function
                                 renderer = extension.components[component_id]
-                                
-                                # Try to render the component
-                                try:
-                                    if callable(renderer):
-                                        component_data = renderer()
-                                        
-                                        # If the renderer returns a dictionary with HTML, add it
-                                        if isinstance(component_data, dict) and "html" in component_data:
-                                            mount_points[mount_point].append({
-                                                "id": component_id,
-                                                "extension": ext_info.name,
-                                                "html": component_data["html"],
-                                            })
-                                except Exception as e:
-                                    # Log error but continue with other components
-                                    print(f"Error rendering component {component_id} from {ext_info.name}: {e}")
-            
-            return {
-                "success": True,
-                "components": mount_points,
-            }
+
+                                if callable(renderer):
+                                    # Serve memoized output unless the
+                                    # renderer opts out with no_cache
+                                    if not getattr(renderer, "no_cache", False):
+                                        cached = _component_cache.get((ext_name, component_id))
+                                        if (cached is not None
+                                                and cached[0] == reg_version
+                                                and now - cached[1] < _COMPONENT_CACHE_TTL):
+                                            mount_points[mount_point].append(cached[2])
+                                            continue
+
+                                    render_jobs.append(
+                                        (mount_point, component_id, ext_name, renderer)
+                                    )
+
+            if render_jobs:
+                results = await asyncio.gather(*[
+                    renderer() if asyncio.iscoroutinefunction(renderer)
+                    else run_in_threadpool(renderer)
+                    for _, _, _, renderer in render_jobs
+                ], return_exceptions=True)
+
+                # Assemble in job order so output ordering is stable
+                for (mount_point, component_id, ext_name, renderer), component_data in zip(render_jobs, results):
+                    if isinstance(component_data, Exception):
+                        # Log error but continue with other components;
+                        # arg-style formatting defers the string build
+                        logger.warning(
+                            "Error rendering component %s from %s: %s",
+                            component_id, ext_name, component_data,
+                        )
+                        continue
+
+                    # If the renderer returns a dictionary with HTML, add it
+                    if isinstance(component_data, dict) and "html" in component_data:
+                        entry = {
+                            "id": component_id,
+                            "extension": ext_name,
+                            "html": component_data["html"],
+                        }
+                        mount_points[mount_point].append(entry)
+                        if not getattr(renderer, "no_cache", False):
+                            _component_cache[(ext_name, component_id)] = (reg_version, now, entry)
+
+            if msgpack is not None and "application/x-msgpack" in request.headers.get("accept", ""):
+                return _negotiated_response(request, {
+                    "success": True,
+                    "components": mount_points,
+                })
+
+            # Stream one JSON chunk per mount point so the first bytes
+            # go out before the whole payload is serialized
+            async def stream_components():
+                yield b'{"success":true,"components":{'
+                for index, (mount_point, components) in enumerate(mount_points.items()):
+                    chunk = json_dumps(mount_point) + b":" + json_dumps(components)
+                    yield b"," + chunk if index else chunk
+                yield b"}}"
+
+            return StreamingResponse(stream_components(), media_type="application/json")
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -240,18 +379,25 @@ def create_router(registry: ExtensionRegistry) -> APIRouter:
     async def execute_hook_endpoint(hook_name: str, request: Request):
         """Execute a hook."""
         try:
-            # Get request body if any
+            # Get request body if any; parse JSON once here so hooks get
+            # a ready dict, falling back to raw bytes for binary payloads
             body = await request.body()
-            data = body if body else None
+            if body:
+                try:
+                    data = json_loads(body)
+                except ValueError:
+                    data = body
+            else:
+                data = None
             
             # Execute the hook
             result = await execute_hook(hook_name, data)
             
-            return {
+            return DefaultJSONResponse({
                 "success": True,
                 "hook": hook_name,
                 "result": result if result is not None else "Hook executed",
-            }
+            })
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
             
@@ -2,38 +2,121 @@
 UI rendering for the extension manager.
 """
 
+import functools
+import gzip
+import hashlib
 import os
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from fastapi import Request, Response
 from fastapi.responses import HTMLResponse
 
+from open_webui_extensions.extension_system.registry import get_registry
+
 # Get the directory of this file
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
-# Create a Jinja2 environment for loading templates
-env = Environment(
-    loader=FileSystemLoader(os.path.join(current_dir, "templates")),
-    autoescape=select_autoescape(['html', 'xml'])
-)
+
+@functools.lru_cache()
+def _get_env():
+    """Build the Jinja2 environment on first use.
+
+    Deferring the import and FileSystemLoader construction keeps module
+    import side-effect free and cheap.
+    """
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+    return Environment(
+        loader=FileSystemLoader(os.path.join(current_dir, "templates")),
+        autoescape=select_autoescape(['html', 'xml'])
+    )
+
+
+# Compiled templates, resolved once instead of per request
+_extensions_template = None
+_extension_detail_template = None
+
+# Single-slot cache of the rendered extensions page, keyed by the
+# visible extension state so mutations invalidate it naturally
+_extensions_page_cache = None
+
+
+def _get_extensions_template():
+    """Get the compiled extensions list template."""
+    global _extensions_template
+    if _extensions_template is None:
+        _extensions_template = _get_env().get_template("extensions.html")
+    return _extensions_template
+
+
+def _get_extension_detail_template():
+    """Get the compiled extension detail template."""
+    global _extension_detail_template
+    if _extension_detail_template is None:
+        _extension_detail_template = _get_env().get_template("extension_detail.html")
+    return _extension_detail_template
+
+
+@functools.lru_cache(maxsize=32)
+def _etag_for(html: str) -> str:
+    """Compute a short ETag for a rendered page."""
+    return f'"{hashlib.blake2b(html.encode("utf-8"), digest_size=8).hexdigest()}"'
+
+
+@functools.lru_cache(maxsize=32)
+def _gzip_for(html: str) -> bytes:
+    """Gzip a rendered page, cached alongside the page itself."""
+    return gzip.compress(html.encode("utf-8"), 6)
+
+
+def _html_response(request: Request, html: str) -> Response:
+    """Build the response for a rendered page.
+
+    Answers conditional requests with an empty 304 and serves a cached
+    gzip body to clients that accept it, mirroring how the dev server
+    precompresses static assets.
+
+    Args:
+        request: The incoming request.
+        html: The rendered page.
+
+    Returns:
+        The HTTP response.
+    """
+    etag = _etag_for(html)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    if len(html) >= 1024 and "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            _gzip_for(html),
+            media_type="text/html; charset=utf-8",
+            headers={
+                "ETag": etag,
+                "Content-Encoding": "gzip",
+                "Vary": "Accept-Encoding",
+            },
+        )
+    return HTMLResponse(html, headers={"ETag": etag})
 
 
 def register_ui_routes(app):
     """Register UI routes for the extension manager.
-    
+
     Args:
         app: The FastAPI application.
     """
-    @app.get("/admin/extensions")
-    async def get_extensions_manager():
+    # Sync handlers: rendering does no I/O awaits, so FastAPI runs these
+    # in its threadpool instead of blocking the event loop on CPU work
+    @app.get("/admin/extensions", response_class=HTMLResponse)
+    def get_extensions_manager(request: Request):
         """Render the extensions manager page."""
-        return HTMLResponse(render_extensions_page())
-    
-    @app.get("/admin/extensions/{name}")
-    async def get_extension_detail(name: str):
+        return _html_response(request, render_extensions_page())
+
+    @app.get("/admin/extensions/{name}", response_class=HTMLResponse)
+    def get_extension_detail(request: Request, name: str):
         """Render the extension detail page."""
-        return HTMLResponse(render_extension_detail_page(name))
+        return _html_response(request, render_extension_detail_page(name))
 
 
 def render_extensions_page() -> str:
@@ -42,18 +125,26 @@ def render_extensions_page() -> str:
     Returns:
         The HTML content of the extensions manager page.
     """
-    # Use absolute import instead of relative
-    from open_webui_extensions.extension_system.registry import get_registry
-    
+    global _extensions_page_cache
+
     # Get the extension registry
     registry = get_registry()
-    
+
     # Get all extensions
     extensions = registry.list_extensions()
-    
+
+    # Reuse the rendered page while the visible extension state is
+    # unchanged; any install/enable/settings change alters the key
+    state_key = tuple(
+        (ext.name, ext.version, ext.active, ext.error) for ext in extensions
+    )
+    if _extensions_page_cache is not None and _extensions_page_cache[0] == state_key:
+        return _extensions_page_cache[1]
+
     # Render the template
-    template = env.get_template("extensions.html")
-    return template.render(extensions=extensions)
+    html = _get_extensions_template().render(extensions=extensions)
+    _extensions_page_cache = (state_key, html)
+    return html
 
 
 def render_extension_detail_page(name: str) -> str:
@@ -65,9 +156,6 @@ def render_extension_detail_page(name: str) -> str:
     Returns:
         The HTML content of the extension detail page.
     """
-    # Use absolute import instead of relative
-    from open_webui_extensions.extension_system.registry import get_registry
-    
     # Get the extension registry
     registry = get_registry()
     
@@ -76,8 +164,7 @@ def render_extension_detail_page(name: str) -> str:
     extension_instance = registry.get_extension_instance(name)
     
     # Render the template
-    template = env.get_template("extension_detail.html")
-    return template.render(
+    return _get_extension_detail_template().render(
         extension_info=extension_info,
         extension_instance=extension_instance
     )
@@ -3,6 +3,8 @@
 Script to patch Open WebUI with the extension system.
 """
 
+import functools
+import mmap
 import os
 import sys
 import re
@@ -14,49 +16,99 @@ from typing import Optional, List, Tuple
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("webui-extensions.patcher")
 
-def find_openwebui_main_path() -> Optional[str]:
+# Compiled once at import instead of per call
+_APP_RE = re.compile(r'app\s*=\s*FastAPI\s*\(')
+
+# Lines spliced into main.py, as module constants
+IMPORT_BLOCK = [
+    "# Extension system import",
+    "from open_webui_extensions.plugin import initialize_extension_system",
+    "",
+]
+INIT_BLOCK = [
+    "# Initialize extension system",
+    "app = initialize_extension_system(app)",
+    "",
+]
+
+# Matches the start of any import line, indented or not, mirroring the
+# strip().startswith(('import ', 'from ')) test this replaced
+_IMPORT_RE = re.compile(r'^[ \t]*(?:import|from) ', re.M)
+
+_IMPORT_BLOB = "\n".join(IMPORT_BLOCK) + "\n"
+_INIT_BLOB = "\n".join(INIT_BLOCK) + "\n"
+
+@functools.lru_cache(maxsize=1)
+def _probe_openwebui_main_path() -> Optional[str]:
     """
-    Find the path to Open WebUI's main.py file.
-    
+    Probe for Open WebUI's main.py without user interaction.
+
+    Memoized so repeated patcher runs in the same process pay the
+    filesystem lookups only once.
+
     Returns:
         The path to the main.py file, or None if not found.
     """
-    # Method 1: Check common installation paths
-    common_paths = [
-        "/usr/local/lib/python3.*/site-packages/open_webui/main.py",
-        "/usr/lib/python3.*/site-packages/open_webui/main.py",
-        os.path.expanduser("~/.local/lib/python3.*/site-packages/open_webui/main.py"),
-        os.path.expanduser("~/venv/lib/python3.*/site-packages/open_webui/main.py"),
-    ]
-    
-    for path_pattern in common_paths:
-        try:
-            import glob
-            matching_paths = glob.glob(path_pattern)
-            if matching_paths:
-                return matching_paths[0]
-        except Exception as e:
-            logger.error(f"Error checking {path_pattern}: {e}")
-    
-    # Method 2: Try to find Open WebUI package
+    # Method 1: Try to find Open WebUI package via the import machinery,
+    # which answers from its cache in the normal installed case
     try:
         import importlib.util
         openwebui_spec = importlib.util.find_spec("open_webui")
         if openwebui_spec:
             logger.info(f"Found Open WebUI package at {openwebui_spec.origin}")
-            
-            # Look for main.py
+
+            # Look for main.py; opening directly avoids a separate
+            # exists() stat before the caller reads the file anyway
             main_path = os.path.join(os.path.dirname(openwebui_spec.origin), "main.py")
-            if os.path.exists(main_path):
-                return main_path
+            try:
+                with open(main_path):
+                    return main_path
+            except OSError:
+                pass
     except Exception as e:
         logger.error(f"Error finding Open WebUI package: {e}")
-    
-    # Method 3: Ask the user
+
+    # Method 2: Scan common installation bases with one directory pass
+    # each, instead of a glob fan-out per pattern
+    candidate_bases = [
+        "/usr/local/lib",
+        "/usr/lib",
+        os.path.expanduser("~/.local/lib"),
+        os.path.expanduser("~/venv/lib"),
+    ]
+
+    for base in candidate_bases:
+        try:
+            with os.scandir(base) as entries:
+                for entry in entries:
+                    if entry.name.startswith("python3."):
+                        candidate = os.path.join(
+                            entry.path, "site-packages", "open_webui", "main.py"
+                        )
+                        if os.path.isfile(candidate):
+                            return candidate
+        except OSError:
+            continue
+
+    return None
+
+
+def find_openwebui_main_path() -> Optional[str]:
+    """
+    Find the path to Open WebUI's main.py file.
+
+    Returns:
+        The path to the main.py file, or None if not found.
+    """
+    main_path = _probe_openwebui_main_path()
+    if main_path:
+        return main_path
+
+    # Fall back to asking the user; interactive answers are not cached
     user_path = input("Enter the path to Open WebUI's main.py file: ")
     if os.path.isfile(user_path) and os.path.basename(user_path) == "main.py":
         return user_path
-    
+
     logger.error("Could not find Open WebUI's main.py file")
     return None
 
@@ -72,7 +124,21 @@ def backup_file(file_path: str) -> Optional[str]:
     """
     try:
         backup_path = f"{file_path}.bak"
-        shutil.copyfile(file_path, backup_path)
+        try:
+            # copy_file_range lets the kernel clone or server-side copy
+            # the data (reflink on btrfs, offloaded copy on NFS) instead
+            # of round-tripping every byte through userspace
+            with open(file_path, "rb") as src, open(backup_path, "wb") as dst:
+                src_fd = src.fileno()
+                dst_fd = dst.fileno()
+                remaining = os.fstat(src_fd).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+        except (AttributeError, OSError):
+            shutil.copyfile(file_path, backup_path)
         logger.info(f"Created backup at {backup_path}")
         return backup_path
     except Exception as e:
@@ -89,22 +155,28 @@ def find_app_creation(content: str) -> Optional[Tuple[int, int]]:
     Returns:
         A tuple of (start_line, end_line), or None if not found.
     """
-    # Look for app = FastAPI(...) pattern
-    lines = content.splitlines()
-    app_pattern = re.compile(r'app\s*=\s*FastAPI\s*\(')
-    
-    for i, line in enumerate(lines):
-        if app_pattern.search(line):
-            # Find the end of the statement (might be multi-line)
-            end_line = i
-            parentheses_count = line.count('(') - line.count(')')
-            while parentheses_count > 0 and end_line < len(lines) - 1:
-                end_line += 1
-                parentheses_count += lines[end_line].count('(') - lines[end_line].count(')')
-            
-            return (i, end_line)
-    
-    return None
+    # Look for app = FastAPI(...) pattern on the raw string so the file
+    # is never split into a per-line list
+    match = _APP_RE.search(content)
+    if not match:
+        return None
+
+    start_line = content.count('\n', 0, match.start())
+
+    # Find the end of the statement (might be multi-line) with a
+    # balanced-parenthesis walk from the opening paren
+    depth = 1
+    pos = match.end()
+    while pos < len(content) and depth > 0:
+        char = content[pos]
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        pos += 1
+
+    end_line = start_line + content.count('\n', match.start(), pos)
+    return (start_line, end_line)
 
 def patch_main_file(main_path: str) -> bool:
     """
@@ -117,50 +189,90 @@ def patch_main_file(main_path: str) -> bool:
         True if patching was successful, False otherwise.
     """
     try:
-        # Read the file
-        with open(main_path, 'r') as f:
-            content = f.read()
-        
-        # Check if already patched
-        if "open_webui_extensions.plugin" in content:
-            logger.info("File already contains extension system imports")
-            return True
-        
+        # Scan the file through mmap so the common "already patched"
+        # re-run never copies the content into userspace, let alone
+        # decodes it; the kernel pages in only what the scan touches
+        with open(main_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Check if already patched
+                if mm.find(b"open_webui_extensions.plugin") != -1:
+                    logger.info("File already contains extension system imports")
+                    return True
+
+                content = mm[:].decode("utf-8")
+
         # Backup the file
         backup_path = backup_file(main_path)
         if not backup_path:
             return False
         
-        # Find the import section to add our import
-        lines = content.splitlines()
-        
-        # Find the last import line
-        last_import_line = 0
-        for i, line in enumerate(lines):
-            if line.strip().startswith(('import ', 'from ')):
-                last_import_line = i
-        
-        # Add our import after the last import
-        lines.insert(last_import_line + 1, "# Extension system import")
-        lines.insert(last_import_line + 2, "from open_webui_extensions.plugin import initialize_extension_system")
-        lines.insert(last_import_line + 3, "")
-        
-        # Find where the app is created
-        app_lines = find_app_creation(content)
-        if not app_lines:
+        # Find the FastAPI app statement first: the import insertion
+        # point is only searched before it, so function-local imports
+        # later in the file can never push our block past the app line
+        match = _APP_RE.search(content)
+        if not match:
             logger.error("Could not find FastAPI app creation in the file")
             return False
-        
-        # Add our initialization after the app creation
-        end_line = app_lines[1]
-        lines.insert(end_line + 1, "# Initialize extension system")
-        lines.insert(end_line + 2, "app = initialize_extension_system(app)")
-        lines.insert(end_line + 3, "")
-        
-        # Write the modified content back to the file
-        with open(main_path, 'w') as f:
-            f.write('\n'.join(lines))
-        
+
+        # Find the byte offset just past the last import line preceding
+        # the app statement; both insertion points are computed on the
+        # raw string so the file is never split into lines and re-joined
+        import_offset = 0
+        last_import = None
+        for last_import in _IMPORT_RE.finditer(content, 0, match.start()):
+            pass
+        if last_import is not None:
+            newline = content.find('\n', last_import.end())
+            import_offset = len(content) if newline == -1 else newline + 1
+
+        depth = 1
+        pos = match.end()
+        while pos < len(content) and depth > 0:
+            char = content[pos]
+            if char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+            pos += 1
+        newline = content.find('\n', pos)
+        app_offset = len(content) if newline == -1 else newline + 1
+
+        # Splice both blocks in with one concatenation
+        new_content = (
+            content[:import_offset]
+            + _IMPORT_BLOB
+            + content[import_offset:app_offset]
+            + _INIT_BLOB
+            + content[app_offset:]
+        )
+
+        # Write the modified content back with write(2) of the
+        # pre-encoded payload, bypassing the text-I/O encoder and buffer.
+        # The file was opened with O_TRUNC, so a short write must not be
+        # reported as success — loop until done and fail loudly otherwise.
+        payload = new_content.encode("utf-8")
+        written = 0
+        fd = os.open(main_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while written < len(payload):
+                count = os.write(fd, view[written:])
+                if count == 0:
+                    break
+                written += count
+        except OSError as e:
+            logger.error(f"Error writing patched file: {e}")
+        finally:
+            os.close(fd)
+
+        if written != len(payload):
+            logger.error(
+                f"Short write to {main_path}: {written} of {len(payload)} bytes"
+            )
+            print(f"\nError: failed to write the patched {main_path}.")
+            print(f"The file may be truncated; restore it from {backup_path}.")
+            return False
+
         logger.info(f"Successfully patched {main_path}")
         print(f"\nSuccessfully patched {main_path}")
         print("The extension system has been integrated into Open WebUI.")
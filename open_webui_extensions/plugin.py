@@ -6,26 +6,151 @@ This module provides API integration with Open WebUI application.
 
 import os
 import logging
+import threading
 from typing import Any, Dict, List, Optional, Type
 
 from fastapi import FastAPI, Request, Response
 
 logger = logging.getLogger("webui-extensions.plugin")
 
-# Check if we have access to needed modules
-try:
-    from fastapi.middleware.base import BaseHTTPMiddleware
-    HAS_MIDDLEWARE = True
-except ImportError:
-    logger.warning("fastapi.middleware.base not found, some features will be disabled")
-    HAS_MIDDLEWARE = False
-    # Create a dummy BaseHTTPMiddleware class
-    class BaseHTTPMiddleware:
-        def __init__(self, app):
-            self.app = app
-        
-        async def __call__(self, scope, receive, send):
-            await self.app(scope, receive, send)
+# Hook entry points, imported once on the first chat request and cached
+# here so app startup does not pay for the hooks module
+_execute_hook = None
+_has_listeners = None
+
+
+# Chat route middleware as a pure ASGI callable: non-chat traffic
+# short-circuits straight to the app without the task group and queues
+# BaseHTTPMiddleware sets up per request. Invariant: this class must
+# stay free of create_task/task groups/queues — only awaiting self.app,
+# receive and send — so event loops with C-level coroutine scheduling
+# (uvloop) can chain it without spawning tasks. Defined at module scope
+# so repeated initialize() calls reuse one class object and callbacks
+# resolve through module globals rather than closure cells.
+class ChatMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        global _execute_hook, _has_listeners
+
+        # Only process chat completion requests
+        if (scope.get("type") != "http"
+                or scope.get("path") != "/api/chat/completions"
+                or scope.get("method") != "POST"):
+            return await self.app(scope, receive, send)
+
+        if _execute_hook is None:
+            from open_webui_extensions.extension_system.hooks import (
+                execute_hook,
+                has_listeners,
+            )
+            _execute_hook = execute_hook
+            _has_listeners = has_listeners
+
+        if _has_listeners("chat_pre_process"):
+            # Buffer the request body so the pre-processing hook
+            # can rewrite it before the app consumes it
+            parts = []
+            while True:
+                message = await receive()
+                parts.append(message.get("body", b""))
+                if not message.get("more_body"):
+                    break
+            body = b"".join(parts)
+
+            # Execute the pre-processing hook
+            try:
+                modified_body = await _execute_hook("chat_pre_process", body)
+                # Identity check: hooks return the same object when
+                # nothing changed, so no byte comparison is needed
+                if modified_body is not None and modified_body is not body:
+                    body = modified_body
+            except Exception as e:
+                logger.error(f"Error in chat_pre_process hook: {e}")
+
+            replayed = False
+
+            async def replay_receive():
+                nonlocal replayed
+                if replayed:
+                    # Delegate to the real channel so streaming responses
+                    # that await receive() to watch for client disconnects
+                    # keep working instead of seeing a fake disconnect
+                    return await receive()
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+        else:
+            # No listener: let the app consume the original
+            # receive channel without materializing the body
+            replay_receive = receive
+
+        # Without a post-process listener there is nothing to
+        # do with the response: forward it untouched so
+        # streamed completions keep streaming
+        if not _has_listeners("chat_post_process"):
+            return await self.app(scope, replay_receive, send)
+
+        # Buffer the response so the post-processing hook sees
+        # the complete body. Event streams are never buffered —
+        # holding an SSE completion until it finishes would
+        # break the clients consuming it.
+        start_message = None
+        response_parts = []
+        streaming = False
+
+        async def buffer_send(message):
+            nonlocal start_message, streaming
+            if streaming:
+                return await send(message)
+            if message["type"] == "http.response.start":
+                start_message = message
+                for key, value in message.get("headers", []):
+                    if (key.lower() == b"content-type"
+                            and b"text/event-stream" in value.lower()):
+                        streaming = True
+                        return await send(message)
+            elif message["type"] == "http.response.body":
+                response_parts.append(message.get("body", b""))
+
+        await self.app(scope, replay_receive, buffer_send)
+
+        if streaming:
+            return
+
+        response_body = b"".join(response_parts)
+
+        # Execute the post-processing hook
+        body_changed = False
+        try:
+            modified_body = await _execute_hook("chat_post_process", response_body)
+            if modified_body is not None and modified_body is not response_body:
+                response_body = modified_body
+                body_changed = True
+        except Exception as e:
+            logger.error(f"Error in chat_post_process hook: {e}")
+
+        if start_message is not None:
+            if body_changed:
+                # Only rebuild headers when the length changed
+                headers = [
+                    (key, value) for key, value in start_message.get("headers", [])
+                    if key.lower() != b"content-length"
+                ]
+                headers.append(
+                    (b"content-length", str(len(response_body)).encode("latin-1"))
+                )
+                await send({
+                    "type": "http.response.start",
+                    "status": start_message["status"],
+                    "headers": headers,
+                })
+            else:
+                # Unchanged body: replay the original start
+                # message without copying its headers
+                await send(start_message)
+        await send({"type": "http.response.body", "body": response_body})
+
 
 class OpenWebUIExtensionsPlugin:
     """
@@ -51,7 +176,17 @@ class OpenWebUIExtensionsPlugin:
         """
         try:
             self.app = app
-            
+
+            # Re-running initialization (tests, reloads, repeated wrapper
+            # calls) would register the router and middleware again,
+            # growing the route table; a flag on app.state makes it
+            # idempotent
+            state = getattr(app, "state", None)
+            if state is not None and getattr(state, "_webui_ext_initialized", False):
+                logger.info("Extension system already initialized; skipping")
+                self.initialized = True
+                return True
+
             # Initialize the extension system
             from open_webui_extensions.extension_system.registry import initialize_registry
             registry = initialize_registry()
@@ -61,13 +196,22 @@ class OpenWebUIExtensionsPlugin:
             router = create_router(registry)
             self.app.include_router(router, prefix="/api/extensions", tags=["extensions"])
             
-            # Initialize extensions
-            registry.initialize_all()
-            
-            # Register hooks if middleware is available
-            if HAS_MIDDLEWARE:
-                self._register_hooks()
-            
+            # Initialize extensions off the startup path: discovery is
+            # metadata-only, so the expensive part is importing and
+            # activating each active extension, which can proceed while
+            # the app starts serving
+            threading.Thread(
+                target=registry.initialize_all,
+                name="extension-init",
+                daemon=True,
+            ).start()
+
+            # Register hooks
+            self._register_hooks()
+
+            if state is not None:
+                state._webui_ext_initialized = True
+
             logger.info("Open WebUI Extensions plugin initialized successfully.")
             logger.info("API available at /api/extensions")
             logger.info("Use separate extension manager at http://localhost:5000/admin/extensions")
@@ -79,80 +223,14 @@ class OpenWebUIExtensionsPlugin:
             return False
     
     def _register_hooks(self) -> None:
-        """Register hooks for chat processing if middleware is available."""
-        # Skip if middleware isn't available
-        if not HAS_MIDDLEWARE:
-            logger.warning("Middleware not available, skipping hook registration")
-            return
-            
+        """Register hooks for chat processing."""
+        # Add the middleware if possible
         try:
-            # Import our hooks system
-            from open_webui_extensions.extension_system.hooks import execute_hook
-            
-            # Register chat route middleware
-            class ChatMiddleware(BaseHTTPMiddleware):
-                async def dispatch(self, request, call_next):
-                    # Only process chat completion requests
-                    if request.url.path == "/api/chat/completions" and request.method == "POST":
-                        # Get the body before it's consumed
-                        body = await request.body()
-                        
-                        # Execute the pre-processing hook
-                        try:
-                            modified_body = await execute_hook("chat_pre_process", body)
-                            if modified_body and modified_body != body:
-                                # Replace the request body with our modified version
-                                request._body = modified_body
-                        except Exception as e:
-                            logger.error(f"Error in chat_pre_process hook: {e}")
-                    
-                    # Continue with the request
-                    response = await call_next(request)
-                    
-                    # Post-process the response for chat completions
-                    if request.url.path == "/api/chat/completions" and request.method == "POST":
-                        try:
-                            # Get the response content
-                            body = b""
-                            async for chunk in response.body_iterator:
-                                body += chunk
-                            
-                            # Execute the post-processing hook
-                            modified_body = await execute_hook("chat_post_process", body)
-                            
-                            # If the hook modified the body, return a new response
-                            if modified_body and modified_body != body:
-                                from fastapi.responses import Response
-                                return Response(
-                                    content=modified_body,
-                                    status_code=response.status_code,
-                                    headers=dict(response.headers),
-                                    media_type=response.media_type
-                                )
-                            
-                            # Otherwise, rebuild the original response
-                            from fastapi.responses import Response
-                            return Response(
-                                content=body,
-                                status_code=response.status_code,
-                                headers=dict(response.headers),
-                                media_type=response.media_type
-                            )
-                        except Exception as e:
-                            logger.error(f"Error in chat_post_process hook: {e}")
-                    
-                    return response
-            
-            # Add the middleware if possible
-            try:
-                self.app.add_middleware(ChatMiddleware)
-                logger.info("Registered chat middleware for extension hooks")
-            except Exception as e:
-                logger.error(f"Error adding chat middleware: {e}")
-            
+            self.app.add_middleware(ChatMiddleware)
+            logger.info("Registered chat middleware for extension hooks")
         except Exception as e:
-            logger.error(f"Error registering hooks: {e}")
-    
+            logger.error(f"Error adding chat middleware: {e}")
+
     def get_info(self) -> Dict[str, Any]:
         """
         Get information about the plugin.
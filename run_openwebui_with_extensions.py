@@ -8,16 +8,17 @@ and then runs Open WebUI. This approach avoids modifying the original files.
 
 import os
 import sys
-import importlib
-import importlib.util
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Leave the root logger alone at import time; Open WebUI configures its
+# own logging and a NullHandler keeps our records from warning
 logger = logging.getLogger("webui-extensions-wrapper")
+logger.addHandler(logging.NullHandler())
 
 def main():
     """Main entry point."""
+    # Only configure logging when this script is the entry point
+    logging.basicConfig(level=logging.INFO)
     print("Open WebUI Extensions Wrapper")
     print("===========================")
     print("This script runs Open WebUI with the extensions system enabled.")
@@ -26,51 +27,54 @@ def main():
     # Try to import Open WebUI
     try:
         logger.info("Importing Open WebUI...")
-        import open_webui
-        import open_webui.main
-        
+        # A single dotted import resolves both packages; it also keeps
+        # working if open_webui's __init__ stops re-exporting main
+        import importlib
+        main_module = importlib.import_module("open_webui.main")
+
         # Check if the app exists
-        if not hasattr(open_webui.main, "app"):
+        app = getattr(main_module, "app", None)
+        if app is None:
             logger.error("Could not find the FastAPI app in Open WebUI.")
             print("Error: Could not find the FastAPI app in Open WebUI.")
             return 1
-        
+
         # Import and apply extensions
         try:
             logger.info("Importing extension system...")
             from open_webui_extensions.plugin import initialize_extension_system
-            
+
             logger.info("Initializing extension system...")
-            open_webui.main.app = initialize_extension_system(open_webui.main.app)
-            
+            main_module.app = initialize_extension_system(app)
+
             logger.info("Extension system initialized successfully!")
             print("Open WebUI Extensions initialized successfully!")
         except Exception as e:
             logger.error(f"Error initializing extensions: {e}")
             print(f"Error initializing extensions: {e}")
             return 1
-        
+
         # Find a way to run Open WebUI
-        if hasattr(open_webui.main, "main") and callable(open_webui.main.main):
+        if callable(getattr(main_module, "main", None)):
             logger.info("Starting Open WebUI...")
             print("Starting Open WebUI...")
-            open_webui.main.main()
+            main_module.main()
             return 0
         else:
             # Try to run using uvicorn directly
             logger.info("No 'main' function found, trying to run with uvicorn...")
             import uvicorn
-            
-            # Get app info
-            app_module = "open_webui.main"
-            app_attr = "app"
-            
+
             # Get host and port
             host = os.environ.get("HOST", "0.0.0.0")
             port = int(os.environ.get("PORT", 8080))
-            
+
             print(f"Starting Open WebUI at http://{host}:{port}")
-            uvicorn.run(f"{app_module}:{app_attr}", host=host, port=port, reload=False)
+            # Pass the already-imported app object rather than an import
+            # string, so uvicorn does not re-import open_webui.main (and
+            # re-pay its startup cost) inside its own bootstrap
+            config = uvicorn.Config(main_module.app, host=host, port=port, reload=False)
+            uvicorn.Server(config).run()
             return 0
         
     except ImportError as e:
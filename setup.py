@@ -1,4 +1,37 @@
-from setuptools import setup, find_packages
+import compileall
+import zipapp
+
+from setuptools import Command, setup, find_packages
+
+
+class BuildZipapp(Command):
+    """Build a compressed .pyz of the package for fast cold starts.
+
+    The zip importer serves precompiled modules from one archive, so
+    container/serverless starts skip the per-file stat and compile work
+    of a loose site-packages tree.
+    """
+
+    description = "build webui-extensions.pyz with precompiled bytecode"
+    user_options = []
+
+    def initialize_options(self):
+        pass
+
+    def finalize_options(self):
+        pass
+
+    def run(self):
+        self.run_command("build_py")
+        build_lib = self.get_finalized_command("build_py").build_lib
+        compileall.compile_dir(build_lib, quiet=1)
+        zipapp.create_archive(
+            build_lib,
+            target="webui-extensions.pyz",
+            main="open_webui_extensions.cli:main",
+            compressed=True,
+        )
+
 
 setup(
     name="open-webui-extensions",
@@ -6,14 +39,15 @@ setup(
     description="Extension system for pip-installed Open WebUI",
     author="Open WebUI Team",
     author_email="info@openwebui.com",
-    packages=find_packages(),
+    packages=find_packages(include=["open_webui_extensions", "open_webui_extensions.*"]),
     include_package_data=True,
+    # Compile bytecode at build time so first run skips .py -> .pyc work
+    options={"build_py": {"compile": True, "optimize": 1}},
+    cmdclass={"build_zipapp": BuildZipapp},
     install_requires=[
         "fastapi>=0.68.0",
         "pydantic>=1.8.2",
         "uvicorn>=0.15.0",
-        "aiofiles>=0.7.0",
-        "python-multipart>=0.0.5",
         "PyYAML>=6.0",
         "requests>=2.26.0",
         "jinja2>=3.0.1",